@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """
 Generate OTLP protobuf test data for DuckSpan extension testing.
-Requires: pip install opentelemetry-proto
+Requires: pip install opentelemetry-proto "protobuf>=4.21"
 """
 
 import sys
 import os
 
+# Use the native (upb) protobuf runtime; the pure-Python backend is far slower
+# at building and serializing messages. Must be set before any *_pb2 import.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 # Add the proto directory to Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
@@ -19,6 +23,18 @@ from opentelemetry.proto.metrics.v1 import metrics_pb2
 from opentelemetry.proto.logs.v1 import logs_pb2
 from opentelemetry.proto.common.v1 import common_pb2
 from opentelemetry.proto.resource.v1 import resource_pb2
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() not in ("cpp", "upb"):
+    print(
+        f"Warning: using the {api_implementation.Type()!r} protobuf runtime; "
+        "install protobuf>=4.21 for the native upb backend",
+        file=sys.stderr,
+    )
+
+# Fixed span identifiers, decoded once (bytes type, not strings)
+_TRACE_ID = bytes.fromhex("a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6")
+_SPAN_ID = bytes.fromhex("1122334455667788")
 
 
 def create_resource(service_name="test-service"):
@@ -38,13 +54,23 @@ def create_resource(service_name="test-service"):
     return resource
 
 
+# Built once; generators copy it and only swap in their service name.
+_RESOURCE_PROTOTYPE = create_resource("placeholder")
+
+
+def fill_resource(dst, service_name):
+    """Copy the shared resource prototype into dst with the given service.name"""
+    dst.CopyFrom(_RESOURCE_PROTOTYPE)
+    dst.attributes[0].value.string_value = service_name
+
+
 def generate_traces_data():
     """Generate sample OTLP traces data"""
     traces_data = trace_pb2.TracesData()
 
     # Create a resource span
     resource_span = traces_data.resource_spans.add()
-    resource_span.resource.CopyFrom(create_resource("trace-service"))
+    fill_resource(resource_span.resource, "trace-service")
 
     # Create a scope span
     scope_span = resource_span.scope_spans.add()
@@ -53,9 +79,9 @@ def generate_traces_data():
 
     # Create a span
     span = scope_span.spans.add()
-    # Use valid random-looking IDs (bytes type, not strings)
-    span.trace_id = bytes.fromhex("a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6")
-    span.span_id = bytes.fromhex("1122334455667788")
+    # Use valid random-looking IDs
+    span.trace_id = _TRACE_ID
+    span.span_id = _SPAN_ID
     span.name = "test_span"  # Use underscore instead of dash, pure ASCII
     span.kind = trace_pb2.Span.SPAN_KIND_SERVER
     span.start_time_unix_nano = 1609459200000000000  # 2021-01-01 00:00:00 UTC
@@ -75,7 +101,7 @@ def generate_metrics_data():
 
     # Create a resource metric
     resource_metric = metrics_data.resource_metrics.add()
-    resource_metric.resource.CopyFrom(create_resource("metrics-service"))
+    fill_resource(resource_metric.resource, "metrics-service")
 
     # Create a scope metric
     scope_metric = resource_metric.scope_metrics.add()
@@ -107,7 +133,7 @@ def generate_logs_data():
 
     # Create a resource log
     resource_log = logs_data.resource_logs.add()
-    resource_log.resource.CopyFrom(create_resource("logs-service"))
+    fill_resource(resource_log.resource, "logs-service")
 
     # Create a scope log
     scope_log = resource_log.scope_logs.add()
@@ -129,31 +155,27 @@ def generate_logs_data():
     return logs_data
 
 
+def write_message(path, message):
+    """Serialize a protobuf message once and write it to path"""
+    data = message.SerializeToString()
+    with open(path, "wb") as f:
+        f.write(data)
+    print(f"Generated: {path} ({len(data)} bytes)")
+
+
 def main():
     # Create test data directory
     test_data_dir = os.path.join(project_root, "test", "data")
     os.makedirs(test_data_dir, exist_ok=True)
 
     # Generate and save traces data
-    traces_data = generate_traces_data()
-    traces_file = os.path.join(test_data_dir, "otlp_traces.pb")
-    with open(traces_file, "wb") as f:
-        f.write(traces_data.SerializeToString())
-    print(f"Generated: {traces_file} ({len(traces_data.SerializeToString())} bytes)")
+    write_message(os.path.join(test_data_dir, "otlp_traces.pb"), generate_traces_data())
 
     # Generate and save metrics data
-    metrics_data = generate_metrics_data()
-    metrics_file = os.path.join(test_data_dir, "otlp_metrics.pb")
-    with open(metrics_file, "wb") as f:
-        f.write(metrics_data.SerializeToString())
-    print(f"Generated: {metrics_file} ({len(metrics_data.SerializeToString())} bytes)")
+    write_message(os.path.join(test_data_dir, "otlp_metrics.pb"), generate_metrics_data())
 
     # Generate and save logs data
-    logs_data = generate_logs_data()
-    logs_file = os.path.join(test_data_dir, "otlp_logs.pb")
-    with open(logs_file, "wb") as f:
-        f.write(logs_data.SerializeToString())
-    print(f"Generated: {logs_file} ({len(logs_data.SerializeToString())} bytes)")
+    write_message(os.path.join(test_data_dir, "otlp_logs.pb"), generate_logs_data())
 
     print("\nProtobuf test data generation complete!")
 
@@ -16,6 +16,17 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    def dumps_bytes(record: Dict[str, Any]) -> bytes:
+        return orjson.dumps(record)
+
+except ImportError:
+
+    def dumps_bytes(record: Dict[str, Any]) -> bytes:
+        return json.dumps(record, separators=(",", ":")).encode()
+
 
 def generate_traces_with_nulls() -> List[Dict[str, Any]]:
     """Generate trace spans with NULL/missing values in various fields."""
@@ -234,16 +245,21 @@ def generate_metrics_with_nulls() -> List[Dict[str, Any]]:
     ]
 
 
+# Invariant attribute lists, built once. Records are only serialized, so the
+# same list objects are safely shared between events/links.
+LARGE_ATTRS = [{"key": f"attr_{i}", "value": {"stringValue": f"value_{i}"}} for i in range(100)]
+EVENT_ATTRS = [{"key": f"event_attr_{j}", "value": {"stringValue": f"val_{j}"}} for j in range(10)]
+LINK_ATTRS = [{"key": "link_type", "value": {"stringValue": "reference"}}]
+LINK_IDS = [(f"0000000000000000000000000000{i:04d}", f"00000000000000{i:02d}") for i in range(10)]
+
+
 def generate_large_attributes() -> List[Dict[str, Any]]:
     """Generate records with large attribute maps."""
-    # 100 attributes
-    large_attrs = [{"key": f"attr_{i}", "value": {"stringValue": f"value_{i}"}} for i in range(100)]
-
     return [
         {
             "resourceSpans": [
                 {
-                    "resource": {"attributes": large_attrs[:50]},  # 50 resource attributes
+                    "resource": {"attributes": LARGE_ATTRS[:50]},  # 50 resource attributes
                     "scopeSpans": [
                         {
                             "spans": [
@@ -251,7 +267,7 @@ def generate_large_attributes() -> List[Dict[str, Any]]:
                                     "traceId": "00000000000000000000000000000100",
                                     "spanId": "0000000000000100",
                                     "name": "large_attrs_span",
-                                    "attributes": large_attrs[50:],  # 50 span attributes
+                                    "attributes": LARGE_ATTRS[50:],  # 50 span attributes
                                 }
                             ]
                         }
@@ -265,24 +281,12 @@ def generate_large_attributes() -> List[Dict[str, Any]]:
 def generate_deep_nesting() -> List[Dict[str, Any]]:
     """Generate records with deep nesting (events, links)."""
     # 20 events, each with 10 attributes
-    events = [
-        {
-            "timeUnixNano": f"164000000{i:010d}",
-            "name": f"event_{i}",
-            "attributes": [{"key": f"event_attr_{j}", "value": {"stringValue": f"val_{j}"}} for j in range(10)],
-        }
-        for i in range(20)
-    ]
+    events = []
+    for i in range(20):
+        events.append({"timeUnixNano": f"164000000{i:010d}", "name": f"event_{i}", "attributes": EVENT_ATTRS})
 
     # 10 links
-    links = [
-        {
-            "traceId": f"0000000000000000000000000000{i:04d}",
-            "spanId": f"00000000000000{i:02d}",
-            "attributes": [{"key": "link_type", "value": {"stringValue": "reference"}}],
-        }
-        for i in range(10)
-    ]
+    links = [{"traceId": trace_id, "spanId": span_id, "attributes": LINK_ATTRS} for trace_id, span_id in LINK_IDS]
 
     return [
         {
@@ -308,10 +312,11 @@ def generate_deep_nesting() -> List[Dict[str, Any]]:
 
 
 def write_jsonl(path: Path, records: List[Dict[str, Any]]) -> None:
-    """Write records as newline-delimited JSON."""
-    with open(path, "w") as f:
-        for record in records:
-            f.write(json.dumps(record) + "\n")
+    """Write records as newline-delimited JSON (orjson when available)."""
+    if not records:
+        path.touch()
+        return
+    path.write_bytes(b"\n".join(dumps_bytes(record) for record in records) + b"\n")
 
 
 def write_empty_file(path: Path) -> None:
@@ -40,8 +40,10 @@ import grpc
 EXTENSION = os.environ.get("OTLP_EXTENSION", "build/release/extension/otlp/otlp.duckdb_extension")
 PORT = int(os.environ.get("OTLP_PORT", "4347"))
 TOKEN = "manual-otap-token-0123456789"
-URI = f"otap:localhost:{PORT}"
-TARGET = f"localhost:{PORT}"
+# Literal IPv4 loopback on both ends: no name resolution, no IPv6-then-IPv4 connect race.
+HOST = "127.0.0.1"
+URI = f"otap:{HOST}:{PORT}"
+TARGET = f"ipv4:{HOST}:{PORT}"
 
 ARROW = "/opentelemetry.proto.experimental.arrow.v1"
 ARROW_LOGS = f"{ARROW}.ArrowLogsService/ArrowLogs"
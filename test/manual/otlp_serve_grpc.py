@@ -20,16 +20,29 @@ loopback. It checks the standard OTLP/gRPC unary Export RPCs for all three signa
     -> rows land in otlp_logs / otlp_traces / otlp_metrics_{gauge,sum}
   * a bad token is rejected with UNAUTHENTICATED (and buffers nothing)
   * a clean otlp_stop drains in-flight rows (dropped_rows == 0)
+  * otlp_stop releases the gRPC listener
+  * (opt-in, OTLP_GRPC_BATCH=N) each signal's single Export carries N times
+    as many items, amortizing the per-RPC cost for throughput runs
+  * (opt-in, OTLP_GRPC_STRESS=N) N concurrent logs Exports round-robined over
+    OTLP_GRPC_CHANNELS independent channels all land
 
 Run (requires a built loadable extension; `uv` resolves the deps):
 
     uv run --script test/manual/otlp_serve_grpc.py
     OTLP_EXTENSION=build/release/extension/otlp/otlp.duckdb_extension \\
         OTLP_PORT=4327 uv run --script test/manual/otlp_serve_grpc.py
+    OTLP_GRPC_BATCH=128 uv run --script test/manual/otlp_serve_grpc.py
+    OTLP_GRPC_STRESS=256 OTLP_GRPC_CHANNELS=4 \\
+        uv run --script test/manual/otlp_serve_grpc.py
 """
 
+import itertools
 import os
+import socket
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import duckdb
 import grpc
@@ -54,15 +67,23 @@ from opentelemetry.proto.trace.v1 import trace_pb2 as trace
 EXTENSION = os.environ.get("OTLP_EXTENSION", "build/release/extension/otlp/otlp.duckdb_extension")
 PORT = int(os.environ.get("OTLP_PORT", "4327"))
 TOKEN = "manual-grpc-token-0123456789"
-URI = f"otlp:localhost:{PORT}"
-TARGET = f"localhost:{PORT}"
+# Literal IPv4 loopback on both ends: no name resolution, no IPv6-then-IPv4 connect race.
+HOST = "127.0.0.1"
+URI = f"otlp:{HOST}:{PORT}"
+TARGET = f"ipv4:{HOST}:{PORT}"
 TS = 1_700_000_000_000_000_000
+BATCH = int(os.environ.get("OTLP_GRPC_BATCH", "1"))
+STRESS = int(os.environ.get("OTLP_GRPC_STRESS", "0"))
+STRESS_CHANNELS = int(os.environ.get("OTLP_GRPC_CHANNELS", "4"))
+STRESS_LOGS_PER_REQUEST = 3
+# Loopback gains nothing from compression; pin it off so the channel default can't change it.
+COMPRESSION = grpc.Compression.NoCompression
 
 
-def service_resource():
-    return resource.Resource(
-        attributes=[common.KeyValue(key="service.name", value=common.AnyValue(string_value="grpc-demo"))]
-    )
+# Shared by every request builder; protobuf copies it into each message.
+SERVICE_RESOURCE = resource.Resource(
+    attributes=[common.KeyValue(key="service.name", value=common.AnyValue(string_value="grpc-demo"))]
+)
 
 
 def logs_request(n):
@@ -78,49 +99,54 @@ def logs_request(n):
     return logs_service.ExportLogsServiceRequest(
         resource_logs=[
             logs.ResourceLogs(
-                resource=service_resource(),
+                resource=SERVICE_RESOURCE,
                 scope_logs=[logs.ScopeLogs(scope=common.InstrumentationScope(name="t"), log_records=records)],
             )
         ]
     )
 
 
-def traces_request():
-    span = trace.Span(
-        trace_id=bytes(range(16)),
-        span_id=bytes(range(8)),
-        name="GET /demo",
-        kind=trace.Span.SPAN_KIND_SERVER,
-        start_time_unix_nano=TS,
-        end_time_unix_nano=TS + 1_000_000,
-    )
+def traces_request(n=1):
+    spans = [
+        trace.Span(
+            trace_id=bytes(range(16)),
+            span_id=(0x0001020304050607 + i).to_bytes(8, "big"),  # i == 0 -> bytes(range(8))
+            name="GET /demo",
+            kind=trace.Span.SPAN_KIND_SERVER,
+            start_time_unix_nano=TS + i,
+            end_time_unix_nano=TS + i + 1_000_000,
+        )
+        for i in range(n)
+    ]
     return trace_service.ExportTraceServiceRequest(
         resource_spans=[
             trace.ResourceSpans(
-                resource=service_resource(),
-                scope_spans=[trace.ScopeSpans(scope=common.InstrumentationScope(name="t"), spans=[span])],
+                resource=SERVICE_RESOURCE,
+                scope_spans=[trace.ScopeSpans(scope=common.InstrumentationScope(name="t"), spans=spans)],
             )
         ]
     )
 
 
-def metrics_request():
+def metrics_request(n=1):
     gauge = metrics.Metric(
         name="temperature",
-        gauge=metrics.Gauge(data_points=[metrics.NumberDataPoint(time_unix_nano=TS, as_double=21.5)]),
+        gauge=metrics.Gauge(
+            data_points=[metrics.NumberDataPoint(time_unix_nano=TS + i, as_double=21.5) for i in range(n)]
+        ),
     )
     counter = metrics.Metric(
         name="requests",
         sum=metrics.Sum(
             aggregation_temporality=metrics.AGGREGATION_TEMPORALITY_CUMULATIVE,
             is_monotonic=True,
-            data_points=[metrics.NumberDataPoint(time_unix_nano=TS, as_double=7)],
+            data_points=[metrics.NumberDataPoint(time_unix_nano=TS + i, as_double=7) for i in range(n)],
         ),
     )
     return metrics_service.ExportMetricsServiceRequest(
         resource_metrics=[
             metrics.ResourceMetrics(
-                resource=service_resource(),
+                resource=SERVICE_RESOURCE,
                 scope_metrics=[
                     metrics.ScopeMetrics(scope=common.InstrumentationScope(name="t"), metrics=[gauge, counter])
                 ],
@@ -129,27 +155,89 @@ def metrics_request():
     )
 
 
+# (service stub, request builder) for each signal's valid-token Export.
+SIGNALS = (
+    (logs_grpc.LogsServiceStub, partial(logs_request, 3 * BATCH)),
+    (trace_grpc.TraceServiceStub, partial(traces_request, BATCH)),
+    (metrics_grpc.MetricsServiceStub, partial(metrics_request, BATCH)),
+)
+
+
+def export(channel, stub_cls, build_request, metadata):
+    """Issue one unary Export; raises grpc.RpcError on a non-OK status."""
+    return stub_cls(channel).Export(build_request(), metadata=metadata, timeout=10)
+
+
+class ChannelPool:
+    """Round-robin over n channels. Distinct channel args keep gRPC from sharing one subchannel."""
+
+    def __init__(self, target, n):
+        self._channels = [
+            grpc.insecure_channel(target, options=[("grpc.channel_id", i)], compression=COMPRESSION) for i in range(n)
+        ]
+        self._next = itertools.count()
+
+    def get(self):
+        return self._channels[next(self._next) % len(self._channels)]
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+
+def stress_logs(auth):
+    """Send STRESS concurrent logs Exports over a ChannelPool; returns the rows sent."""
+    pool = ChannelPool(TARGET, STRESS_CHANNELS)
+    build = partial(logs_request, STRESS_LOGS_PER_REQUEST)
+    try:
+        with ThreadPoolExecutor(max_workers=min(STRESS, 64)) as workers:
+            futures = [
+                workers.submit(export, pool.get(), logs_grpc.LogsServiceStub, build, auth) for _ in range(STRESS)
+            ]
+            for fut in futures:
+                fut.result()
+    finally:
+        pool.close()
+    return STRESS * STRESS_LOGS_PER_REQUEST
+
+
+def receiver_stopped(timeout=0.2):
+    """True when nothing accepts TCP connections on PORT (a plain connect, no gRPC handshake)."""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.settimeout(timeout)
+    try:
+        return probe.connect_ex((HOST, PORT)) != 0
+    finally:
+        probe.close()
+
+
 def main():
     failures = []
     con = duckdb.connect(config={"allow_unsigned_extensions": "true"})
     con.execute(f"LOAD '{EXTENSION}'")
     con.execute(f"SELECT * FROM otlp_serve('{URI}', token := '{TOKEN}', transport := 'grpc')")
+    channel = None
     try:
-        channel = grpc.insecure_channel(TARGET)
+        channel = grpc.insecure_channel(TARGET, compression=COMPRESSION)
         grpc.channel_ready_future(channel).result(timeout=10)
         auth = [("authorization", f"Bearer {TOKEN}")]
-        logs_stub = logs_grpc.LogsServiceStub(channel)
-        trace_stub = trace_grpc.TraceServiceStub(channel)
-        metrics_stub = metrics_grpc.MetricsServiceStub(channel)
 
-        # Valid token -> each signal's rows buffered.
-        logs_stub.Export(logs_request(3), metadata=auth, timeout=10)
-        trace_stub.Export(traces_request(), metadata=auth, timeout=10)
-        metrics_stub.Export(metrics_request(), metadata=auth, timeout=10)
+        # Valid token -> each signal's rows buffered. The three Exports are
+        # independent, so issue them concurrently over the shared channel.
+        with ThreadPoolExecutor(max_workers=len(SIGNALS)) as pool:
+            futures = [pool.submit(export, channel, stub_cls, build, auth) for stub_cls, build in SIGNALS]
+            for fut in futures:
+                fut.result()
+
+        stress_rows = 0
+        if STRESS > 0:
+            stress_rows = stress_logs(auth)
+            print(f"[stress] {STRESS} logs Exports over {STRESS_CHANNELS} channels -> {stress_rows} rows")
 
         # Bad token -> UNAUTHENTICATED, nothing buffered.
         try:
-            logs_stub.Export(logs_request(5), metadata=[("authorization", "Bearer wrong")], timeout=10)
+            bad_auth = [("authorization", "Bearer wrong")]
+            export(channel, logs_grpc.LogsServiceStub, partial(logs_request, 5), bad_auth)
             failures.append("bad token was NOT rejected")
         except grpc.RpcError as exc:
             if exc.code() != grpc.StatusCode.UNAUTHENTICATED:
@@ -158,13 +246,16 @@ def main():
         con.execute(f"SELECT * FROM otlp_flush('{URI}')")
 
         expectations = {
-            "otlp_logs": 3,
-            "otlp_traces": 1,
-            "otlp_metrics_gauge": 1,
-            "otlp_metrics_sum": 1,
+            "otlp_logs": 3 * BATCH + stress_rows,
+            "otlp_traces": BATCH,
+            "otlp_metrics_gauge": BATCH,
+            "otlp_metrics_sum": BATCH,
         }
-        for table, want in expectations.items():
-            got = con.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+        # One round trip for all table counts.
+        counts = con.execute(
+            "SELECT " + ", ".join(f"(SELECT count(*) FROM {table})" for table in expectations)
+        ).fetchone()
+        for (table, want), got in zip(expectations.items(), counts):
             if got != want:
                 failures.append(f"{table} has {got} rows, expected {want}")
 
@@ -172,9 +263,20 @@ def main():
         if services != ["grpc-demo"]:
             failures.append(f"service_name = {services}, expected ['grpc-demo']")
     finally:
+        # Close the client side first so it doesn't retry against the stopping server.
+        if channel is not None:
+            channel.close()
         stop = con.execute(f"SELECT * FROM otlp_stop('{URI}')").fetchone()
         if stop[1] != 0:
             failures.append(f"otlp_stop dropped {stop[1]} rows (expected clean drain)")
+        # Poll briefly rather than sleeping a fixed interval before one probe.
+        for _ in range(10):
+            if receiver_stopped():
+                break
+            time.sleep(0.1)
+        else:
+            failures.append(f"port {PORT} still accepts connections after otlp_stop")
+        con.close()
 
     if failures:
         print("FAIL")
@@ -182,8 +284,8 @@ def main():
             print(f"  - {f}")
         sys.exit(1)
     print(
-        "OK: OTLP/gRPC unary Export for logs (3), traces (1), and metrics (gauge+sum) "
-        "ingested; bad token rejected; clean stop"
+        f"OK: OTLP/gRPC unary Export for logs ({3 * BATCH}), traces ({BATCH}), and metrics (gauge+sum) "
+        "ingested; bad token rejected; clean stop; listener released"
     )
 
 